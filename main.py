@@ -1,18 +1,28 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import time
 import base64
 import webbrowser
 import urllib.parse
 import os
+import re
+from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from typing import Dict, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from threading import Event, Lock, Thread
+from typing import Dict, Optional, List, Tuple
 from dotenv import load_dotenv
 from tqdm import tqdm
 from colorama import Fore, Style, init
 from openai import OpenAI
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # Fall back to the pure-Python levenshtein_distance below
+    Levenshtein = None
 # Initialize colorama for cross-platform color support
 init(autoreset=True)
 
@@ -27,72 +37,240 @@ def thread_safe_print(*args, **kwargs):
     with print_lock:
         print(*args, **kwargs)
 
-# Global variable to capture OAuth callback
+# Global variables to capture OAuth callback
 auth_code = None
+auth_event = Event()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 client = OpenAI(api_key=OPENAI_API_KEY)
 
-SPOTIFY_SEARCH_MAX_WORKERS = 5
+SPOTIFY_SEARCH_MAX_WORKERS = 10
+AI_MATCH_BATCH_SIZE = 50
+AI_MATCH_MAX_WORKERS = 4
+# A fuzzy candidate this similar to the NTS track, and this far ahead of the runner-up, is taken without asking the AI
+CLEAR_MATCH_MIN_SIMILARITY = 0.85
+CLEAR_MATCH_MIN_MARGIN = 0.15
+
+# Match through OpenAI's Batch API: half the cost, but results can take up to 24h
+OPENAI_BATCH_MODE = os.getenv("OPENAI_BATCH_MODE", "").lower() in ("1", "true", "yes")
+OPENAI_BATCH_POLL_INTERVAL = 30
+NTS_FETCH_MAX_WORKERS = 20
+NTS_REQUESTS_PER_SECOND = 10
+SPOTIFY_REQUESTS_PER_SECOND = 10
+SPOTIFY_REQUEST_BURST = 20
+SPOTIFY_MAX_RETRIES = 5
+# Non-idempotent requests (adding tracks) are only retried when Spotify certainly didn't process them
+SPOTIFY_RETRY_STATUSES = {429, 500, 502, 503, 504}
+SPOTIFY_POST_RETRY_STATUSES = {429, 503}
+SPOTIFY_TOKEN_FILE = '.spotify_tokens.json'
+SPOTIFY_MAX_QUERY_LENGTH = 250
+# Longest fuzzy match query scored with the bit-parallel edit distance when rapidfuzz is missing
+MYERS_MAX_PATTERN_LENGTH = 64
+
+# Files written to data/<show_alias>/
+TAPES_FILE = 'tapes.ndjson'
+SEARCH_CACHE_FILE = 'search_cache.json'
+TRACKLISTS_FILE = 'tracklists_with_spotify.json'
+PLAYLIST_URIS_FILE = 'playlist_uris.json'
+
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Placeholder names used in NTS tracklists that can never match a Spotify track
+UNSEARCHABLE_NAMES = {'', 'unknown artist', 'unknown title', 'unknown', 'id', '???'}
+
+class TokenBucket:
+    """Thread-safe token bucket refilling `rate` tokens per second, holding at most `burst`"""
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or rate
+        self.tokens = self.burst
+        self.last = time.monotonic()
+        self.lock = Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def create_session(pool_size: int) -> requests.Session:
+    """Create a session keeping one reusable connection per worker thread"""
+    session = requests.Session()
+    # Connections beyond pool_maxsize are closed after use, costing a new TLS handshake next time
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+# Shared session for all NTS requests (keeps connections to nts.live alive)
+nts_session = create_session(NTS_FETCH_MAX_WORKERS)
+nts_session.headers.update({
+    "accept": "application/json",
+    "dnt": "1",
+    "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+})
+nts_limiter = TokenBucket(rate=NTS_REQUESTS_PER_SECOND)
 
 def levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate Levenshtein distance between two strings"""
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
     
     if len(s2) == 0:
         return len(s1)
     
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    # Two preallocated rows, swapped after each character of s1
+    previous_row = list(range(len(s2) + 1))
+    current_row = [0] * (len(s2) + 1)
+    for i, c1 in enumerate(s1, 1):
+        current_row[0] = distance = i
+        for j, c2 in enumerate(s2, 1):
+            # min(insertion, deletion, substitution) without the function call
+            distance += 1
+            insertion = previous_row[j] + 1
+            if insertion < distance:
+                distance = insertion
+            substitution = previous_row[j - 1] + (c1 != c2)
+            if substitution < distance:
+                distance = substitution
+            current_row[j] = distance
+        previous_row, current_row = current_row, previous_row
     
     return previous_row[-1]
 
+def myers_distances(pattern: str, texts: List[str]) -> List[int]:
+    """
+    Levenshtein distance from pattern to each text with Myers' bit-parallel algorithm.
+    Each column of the DP is one integer, so a pattern up to MYERS_MAX_PATTERN_LENGTH fits a machine word.
+    """
+    if not pattern:
+        return [len(text) for text in texts]
+    
+    # Bitmask of the pattern positions holding each character, shared by every text
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << len(pattern)) - 1
+    last_bit = 1 << (len(pattern) - 1)
+    
+    distances = []
+    for text in texts:
+        pv = mask
+        mv = 0
+        score = len(pattern)
+        for c in text:
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & last_bit:
+                score += 1
+            elif mh & last_bit:
+                score -= 1
+            ph = (ph << 1) | 1
+            mh = mh << 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+        distances.append(score)
+    return distances
+
+def edit_distances(query: str, choices: List[str]) -> List[int]:
+    """Levenshtein distance from query to each choice, computed in a single rapidfuzz call when installed"""
+    if Levenshtein is None:
+        if len(query) <= MYERS_MAX_PATTERN_LENGTH:
+            return myers_distances(query, choices)
+        return [levenshtein_distance(query, choice) for choice in choices]
+    
+    distances = [0] * len(choices)
+    for _, distance, index in process.extract(query, choices, scorer=Levenshtein.distance, limit=None):
+        distances[index] = distance
+    return distances
+
+@lru_cache(maxsize=131072)
 def normalize_string(s: str) -> str:
     """Normalize string for comparison"""
-    import re
     # Remove special characters, convert to lowercase, remove extra spaces
-    s = re.sub(r'[^\w\s]', '', s.lower())
-    s = re.sub(r'\s+', ' ', s).strip()
+    s = PUNCTUATION_RE.sub('', s.lower())
+    s = WHITESPACE_RE.sub(' ', s).strip()
     return s
 
+def is_searchable(artist: str, title: str) -> bool:
+    """Check whether a track has enough real information to be worth searching for"""
+    if artist.strip().lower() in UNSEARCHABLE_NAMES or title.strip().lower() in UNSEARCHABLE_NAMES:
+        return False
+    if len(artist) + len(title) < 4:
+        return False
+    # Both search queries would be rejected by Spotify
+    if len(f"{artist} - {title}") > SPOTIFY_MAX_QUERY_LENGTH:
+        return False
+    return True
+
+def json_schema_format(name: str, properties: Dict) -> Dict:
+    """response_format forcing the AI to answer with a JSON object holding exactly these properties"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False
+            }
+        }
+    }
+
+MATCH_RULES = (
+    "Match if the candidate is clearly the SAME SONG/COMPOSITION, even if:\n"
+    "- Spotify lists fewer featured artists/collaborators\n"
+    "- Subtitles, dedications, or parenthetical info differ\n"
+    "- It's a different movement/part of the same classical work\n"
+    "- Track title is slightly simplified\n\n"
+    "DO NOT match if:\n"
+    "- It's a completely different song (even by same artist)\n"
+    "- Only genre/mood is similar but different composition\n"
+    "- Wrong remix version (unless original has no remix specified)\n\n"
+)
+
+def format_candidates(tracks: List[Dict], indent: str = "") -> str:
+    """Number Spotify candidates as 'artists - title' lines for an AI prompt"""
+    lines = ""
+    for i, track in enumerate(tracks, 1):
+        spotify_artists = ", ".join([artist['name'] for artist in track.get('artists', [])])
+        spotify_title = track.get('name', '')
+        lines += f"{indent}{i}. {spotify_artists} - {spotify_title}\n"
+    return lines
+
+def build_match(original_artist: str, original_title: str, track: Dict, distance: float, needs_confirmation: bool) -> Dict:
+    """Describe a chosen Spotify candidate for the original NTS track"""
+    return {
+        'uri': track['uri'],
+        'spotify_artist': ", ".join([artist['name'] for artist in track.get('artists', [])]),
+        'spotify_title': track.get('name', ''),
+        'original_artist': original_artist,
+        'original_title': original_title,
+        'distance': distance,
+        'needs_confirmation': needs_confirmation
+    }
+
 def find_best_match(original_artist: str, original_title: str, tracks: List[Dict], threshold: int = 15) -> Optional[Dict]:
     """
     Find best match using AI, then backup Levenshtein distance, then backup manual confirmation.
     threshold: maximum edit distance to consider (default 15)
     """
-    original_artist_norm = normalize_string(original_artist)
-    original_title_norm = normalize_string(original_title)
-    original_combined = f"{original_artist_norm} {original_title_norm}"
-    
-    best_match = None
-    # If AI fails, fallback to Levenshtein distance
-
     prompt = f"Find the best match for: {original_artist} - {original_title} from the following options:\n"
-    for i, track in enumerate(tracks, 1):
-        spotify_artists = ", ".join([artist['name'] for artist in track.get('artists', [])])
-        spotify_title = track.get('name', '')
-        prompt += f"{i}. {spotify_artists} - {spotify_title}\n"
-    
-    prompt += "\nMatch if the candidate is clearly the SAME SONG/COMPOSITION, even if:\n"
-    prompt += "- Spotify lists fewer featured artists/collaborators\n"
-    prompt += "- Subtitles, dedications, or parenthetical info differ\n"
-    prompt += "- It's a different movement/part of the same classical work\n"
-    prompt += "- Track title is slightly simplified\n\n"
-    
-    prompt += "DO NOT match if:\n"
-    prompt += "- It's a completely different song (even by same artist)\n"
-    prompt += "- Only genre/mood is similar but different composition\n"
-    prompt += "- Wrong remix version (unless original has no remix specified)\n\n"
-    
-    prompt += "Respond with ONLY the number of the match, or 0 if none match the same song."
+    prompt += format_candidates(tracks)
+    prompt += "\n" + MATCH_RULES
+    prompt += "Respond with the number of the match as \"choice\", or 0 if none match the same song."
     try:
         # print(f"{Fore.YELLOW}Using AI to find best match for: {original_artist} - {original_title}")
         response = client.chat.completions.create(
@@ -101,66 +279,160 @@ def find_best_match(original_artist: str, original_title: str, tracks: List[Dict
                 {"role": "system", "content": "You are a helpful assistant that finds the best matching song from a list."},
                 {"role": "user", "content": prompt}
             ],
+            response_format=json_schema_format("choice", {"choice": {"type": "integer"}}),
+            reasoning_effort="minimal",
             temperature=1
         )
         # print(response)
-        answer = response.choices[0].message.content.strip()
+        answer = response.choices[0].message.content
         # print(f"{Fore.YELLOW}AI response: {answer}")
-        choice = int(answer)
+        choice = int(orjson.loads(answer)["choice"])
         if choice > 0 and choice <= len(tracks):
-            selected_track = tracks[choice - 1]
-            spotify_artists = ", ".join([artist['name'] for artist in selected_track.get('artists', [])])
-            spotify_title = selected_track.get('name', '')
-            # print(f"{Fore.GREEN}AI selected match: {spotify_artists} - {spotify_title} for {original_artist} - {original_title}")
-            return {
-                'uri': selected_track['uri'],
-                'spotify_artist': spotify_artists,
-                'spotify_title': spotify_title,
-                'original_artist': original_artist,
-                'original_title': original_title,
-                'distance': 0,
-                'needs_confirmation': False
-            }
+            return build_match(original_artist, original_title, tracks[choice - 1], 0, False)
     except Exception as e:
-        print(f"{Fore.RED}✗ AI matching failed with error: {e}")
+        thread_safe_print(f"{Fore.RED}✗ AI matching failed with error: {e}")
         pass  # If AI fails, fallback to Levenshtein distance
     
-    best_distance = float('inf')
+    return fuzzy_best_match(original_artist, original_title, tracks, threshold)
+
+def bulk_match_request(queries: List[Tuple[str, str, List[Dict]]]) -> Dict:
+    """Build the chat completion request asking the AI to match many queries at once"""
+    prompt = "For each numbered query, pick the candidate that is the same song.\n\n"
+    for q, (original_artist, original_title, tracks) in enumerate(queries, 1):
+        prompt += f"Q{q}: {original_artist} - {original_title}\n"
+        prompt += format_candidates(tracks, indent="  ")
+    prompt += "\n" + MATCH_RULES
+    prompt += (
+        f'Respond with "answers" holding exactly {len(queries)} numbers, '
+        "one per query in order: the number of the matching candidate, or 0 if none match the same song."
+    )
+    return {
+        "model": "gpt-5-nano",
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant that finds the best matching song from a list."},
+            {"role": "user", "content": prompt}
+        ],
+        "response_format": json_schema_format("answers", {"answers": {"type": "array", "items": {"type": "integer"}}}),
+        "reasoning_effort": "minimal",
+        "temperature": 1
+    }
+
+def resolve_bulk_answers(queries: List[Tuple[str, str, List[Dict]]], content: Optional[str], threshold: int = 15) -> List[Optional[Dict]]:
+    """
+    Turn the AI's JSON answers into matches.
+    Falls back to one find_best_match call per query if the answers can't be used.
+    """
+    try:
+        if content is None:
+            raise ValueError("no answer returned")
+        answers = [int(answer) for answer in orjson.loads(content)["answers"]]
+        if len(answers) != len(queries):
+            raise ValueError(f"expected {len(queries)} answers, got {len(answers)}")
+    except Exception as e:
+        thread_safe_print(f"{Fore.RED}✗ Bulk AI matching failed with error: {e}")
+        return [find_best_match(artist, title, tracks, threshold) for artist, title, tracks in queries]
     
-    for track in tracks:
-        # Get Spotify track info
-        spotify_artists = ", ".join([artist['name'] for artist in track.get('artists', [])])
-        spotify_title = track.get('name', '')
+    matches = []
+    for (original_artist, original_title, tracks), choice in zip(queries, answers):
+        if choice > 0 and choice <= len(tracks):
+            matches.append(build_match(original_artist, original_title, tracks[choice - 1], 0, False))
+        else:
+            matches.append(fuzzy_best_match(original_artist, original_title, tracks, threshold))
+    return matches
+
+def find_best_matches_bulk(queries: List[Tuple[str, str, List[Dict]]], threshold: int = 15) -> List[Optional[Dict]]:
+    """Match many (artist, title, candidates) queries with a single AI request"""
+    try:
+        response = client.chat.completions.create(**bulk_match_request(queries))
+    except Exception as e:
+        thread_safe_print(f"{Fore.RED}✗ Bulk AI matching failed with error: {e}")
+        return [find_best_match(artist, title, tracks, threshold) for artist, title, tracks in queries]
+    
+    return resolve_bulk_answers(queries, response.choices[0].message.content, threshold)
+
+def find_best_matches_batch_api(query_batches: List[List[Tuple[str, str, List[Dict]]]]) -> List[List[Optional[Dict]]]:
+    """
+    Match every query batch through a single OpenAI Batch API job (half the cost, but can take hours).
+    Falls back to synchronous bulk requests if the job can't be submitted or doesn't complete.
+    """
+    lines = [
+        orjson.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": bulk_match_request(queries)
+        })
+        for i, queries in enumerate(query_batches)
+    ]
+    
+    try:
+        batch_file = client.files.create(file=("ai_matches.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"{Fore.CYAN}Submitted OpenAI batch {batch.id}, waiting for it to complete...")
         
-        spotify_artist_norm = normalize_string(spotify_artists)
-        spotify_title_norm = normalize_string(spotify_title)
-        spotify_combined = f"{spotify_artist_norm} {spotify_title_norm}"
-        
-        # Calculate distances
-        combined_distance = levenshtein_distance(original_combined, spotify_combined)
-        title_distance = levenshtein_distance(original_title_norm, spotify_title_norm)
-        artist_distance = levenshtein_distance(original_artist_norm, spotify_artist_norm)
-        
-        # Weighted score (title is more important)
-        weighted_distance = (title_distance * 2 + artist_distance) / 3
-        
-        if weighted_distance < best_distance:
-            best_distance = weighted_distance
-            best_match = {
-                'uri': track['uri'],
-                'spotify_artist': spotify_artists,
-                'spotify_title': spotify_title,
-                'original_artist': original_artist,
-                'original_title': original_title,
-                'distance': weighted_distance,
-                'needs_confirmation': weighted_distance > threshold
-            }
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(OPENAI_BATCH_POLL_INTERVAL)
+            batch = client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"batch {batch.id} {batch.status}")
+        
+        contents = {}
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                result = orjson.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    contents[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    except Exception as e:
+        print(f"{Fore.RED}✗ OpenAI batch failed with error: {e}")
+        return [find_best_matches_bulk(queries) for queries in query_batches]
+    
+    # Batches whose line is missing or failed are retried as one synchronous bulk request each
+    return [
+        resolve_bulk_answers(queries, contents[str(i)]) if str(i) in contents else find_best_matches_bulk(queries)
+        for i, queries in enumerate(query_batches)
+    ]
+
+def normalized_candidates(tracks: List[Dict]) -> Tuple[List[str], List[str]]:
+    """
+    Normalize every Spotify candidate once for scoring against an NTS track.
+    Returns: (artists, titles)
+    """
+    artists = [normalize_string(", ".join([artist['name'] for artist in track.get('artists', [])])) for track in tracks]
+    titles = [normalize_string(track.get('name', '')) for track in tracks]
+    return artists, titles
+
+def fuzzy_best_match(original_artist: str, original_title: str, tracks: List[Dict], threshold: int = 15) -> Optional[Dict]:
+    """
+    Find best match by Levenshtein distance, flagging distant matches for manual confirmation.
+    threshold: maximum edit distance to accept without confirmation (default 15)
+    """
+    if not tracks:
+        return None
+    
+    original_artist_norm = normalize_string(original_artist)
+    original_title_norm = normalize_string(original_title)
+    
+    # Score every candidate's title and artists in one call each
+    spotify_artists, spotify_titles = normalized_candidates(tracks)
+    title_distances = edit_distances(original_title_norm, spotify_titles)
+    artist_distances = edit_distances(original_artist_norm, spotify_artists)
+    
+    # Weighted score (title is more important)
+    weighted_distances = [(title_distance * 2 + artist_distance) / 3 for title_distance, artist_distance in zip(title_distances, artist_distances)]
+    best_index = min(range(len(tracks)), key=weighted_distances.__getitem__)
+    best_distance = weighted_distances[best_index]
     
     # Only return if within reasonable threshold (even for confirmation)
-    if best_match and best_match['distance'] <= threshold * 2:
-        return best_match
+    if best_distance > threshold * 2:
+        return None
     
-    return None
+    return build_match(original_artist, original_title, tracks[best_index], best_distance, best_distance > threshold)
 
 def confirm_matches(pending_matches: List[Dict]) -> List[Dict]:
     """
@@ -210,6 +482,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         
         if 'code' in params:
             auth_code = params['code'][0]
+            auth_event.set()
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
@@ -235,31 +508,58 @@ class SpotifyAPI:
         """Initialize with Spotify credentials"""
         self.client_id = client_id
         self.client_secret = client_secret
+        auth_base64 = base64.b64encode(f"{client_id}:{client_secret}".encode("utf-8")).decode("utf-8")
+        self._basic_auth = f"Basic {auth_base64}"
         self.redirect_uri = redirect_uri
-        self.access_token = None
         self.user_token = None
-        self.refresh_token = None
+        self.user_token_expires_at = 0
+        self.session = create_session(SPOTIFY_SEARCH_MAX_WORKERS)
+        self._bucket = TokenBucket(rate=SPOTIFY_REQUESTS_PER_SECOND, burst=SPOTIFY_REQUEST_BURST)
+        self._token_lock = Lock()
+        
+        # Reuse tokens saved by a previous run while they are still valid
+        tokens = self._load_tokens()
+        self.refresh_token = tokens.get('refresh_token')
+        self.access_token = None
+        self.access_token_expires_at = tokens.get('access_token_expires_at', 0)
+        if time.time() < self.access_token_expires_at:
+            self.access_token = tokens.get('access_token')
+            self.session.headers["Authorization"] = f"Bearer {self.access_token}"
+        
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Rate-limited request that retries HTTP 429 (honouring Retry-After) and, for GETs, transient 5xx errors"""
+        retry_statuses = SPOTIFY_RETRY_STATUSES if method == "GET" else SPOTIFY_POST_RETRY_STATUSES
+        for attempt in range(SPOTIFY_MAX_RETRIES):
+            self._bucket.acquire()
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in retry_statuses or attempt == SPOTIFY_MAX_RETRIES - 1:
+                return response
+            retry_after = int(response.headers.get('Retry-After', 2 ** attempt))
+            if response.status_code == 429:
+                thread_safe_print(f"{Fore.YELLOW}Rate limit exceeded. Retrying in {retry_after}s...")
+            time.sleep(retry_after)
         
     def get_access_token(self) -> Optional[str]:
         """Authenticate with Spotify using Client Credentials"""
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_string.encode("utf-8")
-        auth_base64 = base64.b64encode(auth_bytes).decode("utf-8")
-        
         url = "https://accounts.spotify.com/api/token"
         headers = {
-            "Authorization": f"Basic {auth_base64}",
+            "Authorization": self._basic_auth,
             "Content-Type": "application/x-www-form-urlencoded"
         }
         data = {"grant_type": "client_credentials"}
         
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = self.session.post(url, headers=headers, data=data)
             response.raise_for_status()
-            json_result = response.json()
+            json_result = orjson.loads(response.content)
             self.access_token = json_result["access_token"]
+            # Renew a minute early so searches never run with an expired token
+            self.access_token_expires_at = time.time() + json_result.get("expires_in", 3600) - 60
+            self._save_tokens()
+            # Search requests pick this up from the session; user endpoints pass their own header
+            self.session.headers["Authorization"] = f"Bearer {self.access_token}"
             return self.access_token
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"{Fore.RED}✗ Error getting access token: {e}")
             return None
     
@@ -267,6 +567,7 @@ class SpotifyAPI:
         """Start OAuth flow to get user authorization"""
         global auth_code
         auth_code = None
+        auth_event.clear()
         
         scopes = "playlist-modify-public playlist-modify-private"
         
@@ -291,12 +592,11 @@ class SpotifyAPI:
         print(f"{Fore.YELLOW}Waiting for authorization...")
         
         server = HTTPServer(('localhost', 8888), OAuthCallbackHandler)
+        Thread(target=server.serve_forever, daemon=True).start()
         
-        timeout = 120
-        start_time = time.time()
-        
-        while auth_code is None and (time.time() - start_time) < timeout:
-            server.handle_request()
+        auth_event.wait(timeout=120)
+        server.shutdown()
+        server.server_close()
         
         if auth_code is None:
             print(f"\n{Fore.RED}✗ Authorization timeout. Please try again.")
@@ -308,13 +608,9 @@ class SpotifyAPI:
     
     def get_user_token_from_code(self, code: str) -> bool:
         """Exchange authorization code for access token"""
-        auth_string = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_string.encode("utf-8")
-        auth_base64 = base64.b64encode(auth_bytes).decode("utf-8")
-        
         url = "https://accounts.spotify.com/api/token"
         headers = {
-            "Authorization": f"Basic {auth_base64}",
+            "Authorization": self._basic_auth,
             "Content-Type": "application/x-www-form-urlencoded"
         }
         data = {
@@ -324,37 +620,107 @@ class SpotifyAPI:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = self.session.post(url, headers=headers, data=data)
             response.raise_for_status()
-            token_data = response.json()
-            
-            self.user_token = token_data.get("access_token")
-            self.refresh_token = token_data.get("refresh_token")
+            self._store_user_token(orjson.loads(response.content))
             
             print(f"{Fore.GREEN}✓ User token obtained successfully!")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"{Fore.RED}✗ Error getting user token: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"{Fore.RED}Response: {e.response.text}")
             return False
     
-    def search_song_with_fallback(self, artist: str, title: str) -> tuple[Optional[str], bool, Optional[Dict]]:
+    def _ensure_access_token(self) -> bool:
+        """Get a new client token when there is none or it is about to expire"""
+        if self.access_token and time.time() < self.access_token_expires_at:
+            return True
+        
+        # Only one search thread fetches the new token, the rest wait and reuse it
+        with self._token_lock:
+            if self.access_token and time.time() < self.access_token_expires_at:
+                return True
+            return self.get_access_token() is not None
+    
+    def _load_tokens(self) -> Dict:
+        """Load the tokens saved by a previous run"""
+        try:
+            with open(SPOTIFY_TOKEN_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+    
+    def _save_tokens(self):
+        """Persist the current tokens so later runs can skip authenticating"""
+        tokens = {
+            'refresh_token': self.refresh_token,
+            'access_token': self.access_token,
+            'access_token_expires_at': self.access_token_expires_at
+        }
+        # Only the current user may read the tokens; replace the file whole so readers never see a partial write
+        tmp_path = SPOTIFY_TOKEN_FILE + '.tmp'
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(orjson.dumps(tokens))
+        os.replace(tmp_path, SPOTIFY_TOKEN_FILE)
+    
+    def _store_user_token(self, token_data: Dict):
+        """Keep a new user token and persist the refresh token for later runs"""
+        self.user_token = token_data.get("access_token")
+        # Refresh a minute early so long uploads never run with an expired token
+        self.user_token_expires_at = time.time() + token_data.get("expires_in", 3600) - 60
+        
+        # Spotify only sometimes rotates the refresh token
+        if token_data.get("refresh_token"):
+            self.refresh_token = token_data["refresh_token"]
+            self._save_tokens()
+    
+    def refresh_user_token(self) -> bool:
+        """Get a new user token from the saved refresh token, skipping the browser flow"""
+        if not self.refresh_token:
+            return False
+        
+        url = "https://accounts.spotify.com/api/token"
+        headers = {
+            "Authorization": self._basic_auth,
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": self.refresh_token
+        }
+        
+        try:
+            response = self.session.post(url, headers=headers, data=data)
+            response.raise_for_status()
+            self._store_user_token(orjson.loads(response.content))
+            return True
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            print(f"{Fore.RED}✗ Error refreshing user token: {e}")
+            return False
+    
+    def _ensure_user_token(self):
+        """Refresh the user token when it is about to expire"""
+        if time.time() >= self.user_token_expires_at:
+            self.refresh_user_token()
+    
+    def search_song_with_fallback(self, artist: str, title: str) -> tuple[Optional[str], List[Dict]]:
         """
-        Search for a song and return the Spotify URI of the best match.
-        Returns: (uri, needs_confirmation, match_data)
+        Search for a song and return the Spotify URI of a direct match,
+        or the fuzzy search candidates to pick a match from.
+        Raises if Spotify couldn't be searched, so the failure isn't mistaken for a track that isn't on Spotify.
+        Returns: (uri, candidates)
         """
-        if not self.access_token:
-            if not self.get_access_token():
-                return None, False, None
+        if not is_searchable(artist, title):
+            return None, []
+        
+        if not self._ensure_access_token():
+            raise RuntimeError("no Spotify access token")
         
         # First try: structured search
         query = f"artist:{artist} track:{title}"
         url = "https://api.spotify.com/v1/search"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}"
-        }
         params = {
             "q": query,
             "type": "track",
@@ -362,20 +728,15 @@ class SpotifyAPI:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, params=params)
             response.raise_for_status()
-            results = response.json()
+            results = orjson.loads(response.content)
             
             tracks = results.get("tracks", {}).get("items", [])
             if tracks:
-                return tracks[0]["uri"], False, None
-        except requests.exceptions.RequestException as e:
+                return tracks[0]["uri"], []
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             # print(f"{Fore.RED}✗ Error during structured search: {e}")
-            #if 429 Client Error
-            if e.response.status_code == 429:
-                print(f"{Fore.YELLOW}Rate limit exceeded. Retrying...")
-                time.sleep(2)
-                self.search_song_with_fallback(artist, title)
             pass
         
         # Second try: simple search with fuzzy matching
@@ -386,24 +747,14 @@ class SpotifyAPI:
             "limit": 10  # Get multiple results for comparison
         }
         
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            results = response.json()
-            
-            tracks = results.get("tracks", {}).get("items", [])
-            if tracks:
-                # print(f"{Fore.YELLOW}Fuzzy matching for: {artist} - {title}")
-                # for track in tracks:
-                #     print(f"  Found: {', '.join([a['name'] for a in track.get('artists', [])])} - {track.get('name')}")
-                best_match = find_best_match(artist, title, tracks)
-                if best_match:
-                    return best_match['uri'], best_match['needs_confirmation'], best_match
-            
-            return None, False, None
-                
-        except requests.exceptions.RequestException:
-            return None, False, None
+        response = self._request("GET", url, params=params)
+        response.raise_for_status()
+        results = orjson.loads(response.content)
+        
+        # print(f"{Fore.YELLOW}Fuzzy matching for: {artist} - {title}")
+        # for track in tracks:
+        #     print(f"  Found: {', '.join([a['name'] for a in track.get('artists', [])])} - {track.get('name')}")
+        return None, results.get("tracks", {}).get("items", [])
 
     def get_user_id(self) -> Optional[str]:
         """Get the current user's Spotify ID"""
@@ -411,17 +762,19 @@ class SpotifyAPI:
             print(f"{Fore.RED}✗ Error: User token not set")
             return None
         
+        self._ensure_user_token()
+        
         url = "https://api.spotify.com/v1/me"
         headers = {
             "Authorization": f"Bearer {self.user_token}"
         }
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers)
             response.raise_for_status()
-            user_data = response.json()
+            user_data = orjson.loads(response.content)
             return user_data.get("id")
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"{Fore.RED}✗ Error getting user ID: {e}")
             return None
     
@@ -431,6 +784,8 @@ class SpotifyAPI:
             print(f"{Fore.RED}✗ Error: User token not set")
             return None
         
+        self._ensure_user_token()
+        
         url = f"https://api.spotify.com/v1/users/{user_id}/playlists"
         headers = {
             "Authorization": f"Bearer {self.user_token}",
@@ -443,11 +798,11 @@ class SpotifyAPI:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data)
             response.raise_for_status()
-            playlist_data = response.json()
+            playlist_data = orjson.loads(response.content)
             return playlist_data.get("id")
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"{Fore.RED}✗ Error creating playlist: {e}")
             return None
     
@@ -458,91 +813,103 @@ class SpotifyAPI:
             return False
         
         url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
-        headers = {
-            "Authorization": f"Bearer {self.user_token}",
-            "Content-Type": "application/json"
-        }
         
+        # Batches are posted in order: Spotify rejects a position beyond the current playlist length
         with tqdm(total=len(uris), desc=f"{Fore.CYAN}Adding tracks", unit="track") as pbar:
             for i in range(0, len(uris), batch_size):
                 batch = uris[i:i + batch_size]
-                data = {
-                    "uris": batch,
-                    "position": i
-                }
                 
                 try:
-                    response = requests.post(url, headers=headers, json=data)
-                    response.raise_for_status()
+                    self._post_batch(url, batch, i)
                     pbar.update(len(batch))
-                    time.sleep(0.1)
                 except requests.exceptions.RequestException as e:
                     print(f"\n{Fore.RED}✗ Error adding tracks to playlist: {e}")
                     return False
         
         return True
+    
+    def _post_batch(self, url: str, batch: List[str], position: int):
+        """Insert one batch of tracks at the given playlist position"""
+        self._ensure_user_token()
+        headers = {
+            "Authorization": f"Bearer {self.user_token}",
+            "Content-Type": "application/json"
+        }
+        data = {
+            "uris": batch,
+            "position": position
+        }
+        
+        response = self._request("POST", url, headers=headers, json=data)
+        response.raise_for_status()
+
+def fetch_episode_page(base_api_url, offset, limit):
+    """Fetch a single page of the episode listing"""
+    api_url = f"{base_api_url}?offset={offset}&limit={limit}"
+    nts_limiter.acquire()
+    response = nts_session.get(api_url)
+    return orjson.loads(response.content)
 
-def get_all_episode_links(base_api_url, limit=12):
-    """Paginate through the API to get all episode data"""
+def get_all_episode_links(base_api_url, known_episodes: set = frozenset(), limit=12):
+    """Paginate through the API to get data for every episode not in known_episodes"""
     all_episodes = []
-    offset = 0
+    already_scraped = 0
     
     print(f"{Fore.CYAN}Fetching episodes...")
     
-    while True:
-        api_url = f"{base_api_url}?offset={offset}&limit={limit}"
-        
-        response = requests.get(api_url)
-        data = response.json()
-        
-        results = data.get('results', [])
-        if not results:
-            break
+    # The first page tells us how many episodes there are, the rest are fetched in parallel
+    first_page = fetch_episode_page(base_api_url, 0, limit)
+    pages = [first_page]
+    
+    if first_page.get('results'):
+        total_count = first_page.get('metadata', {}).get('resultset', {}).get('count', 0)
+        offsets = range(limit, total_count, limit)
         
-        for episode in results:
+        # The whole listing is always read: an interrupted earlier run can leave unscraped episodes anywhere,
+        # and known episodes removed from NTS mean the number of new ones can't be worked out from counts
+        with ThreadPoolExecutor(max_workers=NTS_FETCH_MAX_WORKERS) as executor:
+            pages.extend(executor.map(lambda offset: fetch_episode_page(base_api_url, offset, limit), offsets))
+    
+    for data in pages:
+        for episode in data.get('results', []):
             episode_alias = episode.get('episode_alias')
             show_alias = episode.get('show_alias')
             broadcast = episode.get('broadcast')
-            if episode_alias and show_alias:
+            if episode_alias in known_episodes:
+                already_scraped += 1
+            elif episode_alias and show_alias:
                 all_episodes.append({
                     'episode_alias': episode_alias,
                     'show_alias': show_alias,
                     'broadcast': broadcast
                 })
-        
-        total_count = data.get('metadata', {}).get('resultset', {}).get('count', 0)
-        offset += limit
-        
-        if offset >= total_count:
-            break
     
-    print(f"{Fore.GREEN}✓ Found {len(all_episodes)} episodes")
+    if known_episodes:
+        print(f"{Fore.GREEN}✓ Found {len(all_episodes)} new episodes ({already_scraped} already scraped)")
+    else:
+        print(f"{Fore.GREEN}✓ Found {len(all_episodes)} episodes")
     return all_episodes
 
-def get_episode_tracklist(show_alias, episode_alias):
-    """Fetch full episode data including tracklist from the API"""
-    api_url = f"https://www.nts.live/shows/{show_alias}/episodes/{episode_alias}"
-    headers = {
-        "accept": "application/json",
-        "dnt": "1",
-        "referer": f"https://www.nts.live/shows/{show_alias}/episodes/{episode_alias}",
-        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
-
+def get_episode_tracklist(episode_url) -> Optional[Tuple[List[Dict], Dict]]:
+    """
+    Fetch full episode data including tracklist from the API.
+    Returns: (tracklist, episode_data), or None if the episode couldn't be fetched
+    """
     try:
-        response = requests.get(api_url, headers=headers)
+        nts_limiter.acquire()
+        response = nts_session.get(episode_url, headers={"referer": episode_url})
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         tracklist = data.get('tracklist', [])
         parsed_tracks = []
         
         for track in tracklist:
-            main_artists = [artist.get('name') for artist in track.get('mainArtists', [])]
-            featuring_artists = [artist.get('name') for artist in track.get('featuringArtists', [])]
-            remix_artists = [artist.get('name') for artist in track.get('remixArtists', [])]
+            # NTS sometimes lists an artist without a name
+            all_artists = [artist['name'] for artist in track.get('mainArtists', []) if artist.get('name')]
+            featuring_artists = [artist['name'] for artist in track.get('featuringArtists', []) if artist.get('name')]
+            remix_artists = [artist['name'] for artist in track.get('remixArtists', []) if artist.get('name')]
             
-            all_artists = main_artists.copy()
             if featuring_artists:
                 all_artists.append(f"ft. {', '.join(featuring_artists)}")
             if remix_artists:
@@ -567,67 +934,187 @@ def get_episode_tracklist(show_alias, episode_alias):
         return parsed_tracks, episode_data
     
     except Exception as e:
-        return [], {}
+        thread_safe_print(f"{Fore.RED}✗ Error fetching {episode_url}: {e}")
+        return None
 
-def process_episode(episode, delay=0.3):
-    """Process a single episode"""
+def process_episode(episode) -> Optional[Dict]:
+    """Process a single episode, or return None if it couldn't be fetched"""
     show_alias = episode['show_alias']
     episode_alias = episode['episode_alias']
     broadcast = episode['broadcast']
     
     episode_url = f"https://www.nts.live/shows/{show_alias}/episodes/{episode_alias}"
     
-    time.sleep(delay)
-    
-    tracklist, metadata = get_episode_tracklist(show_alias, episode_alias)
+    episode_tracklist = get_episode_tracklist(episode_url)
+    if episode_tracklist is None:
+        return None
+    tracklist, metadata = episode_tracklist
     
     tape_data = {
         "episode": episode_alias,
         "broadcast": broadcast,
+        "broadcast_ts": int(datetime.fromisoformat(broadcast.replace('Z', '+00:00')).timestamp()),
         "broadcast_formatted": metadata.get('broadcast_formatted'),
         "url": episode_url,
         "mixcloud": metadata.get('mixcloud'),
         "audio_sources": metadata.get('audio_sources', []),
-        "track_count": len(tracklist),
         "tracklist": tracklist
     }
     
     return tape_data
 
+def clear_best_match(original_artist: str, original_title: str, tracks: List[Dict]) -> Optional[Dict]:
+    """Return the candidate that is an obvious string match for the track, or None if it needs the AI"""
+    original_artist_norm = normalize_string(original_artist)
+    original_title_norm = normalize_string(original_title)
+    spotify_artists, spotify_titles = normalized_candidates(tracks)
+    
+    # Exact matches are the most common case, and are often listed more than once (album and single releases)
+    for track, artists, title in zip(tracks, spotify_artists, spotify_titles):
+        if artists == original_artist_norm and title == original_title_norm:
+            return build_match(original_artist, original_title, track, 0, False)
+    
+    query = f"{original_artist_norm} {original_title_norm}"
+    choices = [f"{artists} {title}" for artists, title in zip(spotify_artists, spotify_titles)]
+    similarities = [
+        1 - distance / max(len(query), len(choice), 1)
+        for distance, choice in zip(edit_distances(query, choices), choices)
+    ]
+    ranked = sorted(range(len(tracks)), key=similarities.__getitem__, reverse=True)
+    best = similarities[ranked[0]]
+    runner_up = similarities[ranked[1]] if len(ranked) > 1 else 0
+    
+    if best < CLEAR_MATCH_MIN_SIMILARITY or best - runner_up < CLEAR_MATCH_MIN_MARGIN:
+        return None
+    
+    return build_match(original_artist, original_title, tracks[ranked[0]], 0, False)
+
 def search_single_track(track: Dict, spotify: SpotifyAPI) -> Dict:
-    """Search for a single track on Spotify"""
+    """Search for a single track on Spotify, recording the result on the track itself"""
     artist = track['artist']
     title = track['title']
     
-    uri, needs_confirmation, match_data = spotify.search_song_with_fallback(artist, title)
+    uri, candidates = spotify.search_song_with_fallback(artist, title)
     
-    if uri:
-        track_result = {
-            **track,
-            'spotify_uri': uri,
-            'found': True
-        }
-        
-        if needs_confirmation and match_data:
-            track_result['pending_confirmation'] = True
-            track_result['match_data'] = match_data
+    track['spotify_uri'] = uri
+    track['found'] = uri is not None
+    
+    # Fuzzy candidates are matched in bulk once all searches are done
+    if candidates:
+        track['candidates'] = candidates
+    
+    return track
+
+def apply_matches(tracks: List[Dict], indices: List[int], matches: List[Optional[Dict]]) -> List[Dict]:
+    """
+    Record AI/fuzzy matches on the tracks they were made for.
+    Returns: pending_confirmations for matches that need the user's approval
+    """
+    pending_confirmations = []
+    
+    for index, match in zip(indices, matches):
+        track = tracks[index]
+        del track['candidates']
         
-        return track_result
-    else:
-        return {
-            **track,
-            'spotify_uri': None,
-            'found': False
+        if match:
+            track['spotify_uri'] = match['uri']
+            track['found'] = True
+            
+            # Check if needs confirmation
+            if match['needs_confirmation']:
+                track['pending_confirmation'] = True
+                track['match_data'] = match
+                pending_confirmations.append({
+                    **match,
+                    'track_index': index
+                })
+    
+    return pending_confirmations
+
+def match_fuzzy_candidates(tracks: List[Dict]) -> List[Dict]:
+    """
+    Pick a match for every track that only has fuzzy search candidates,
+    sending the ones without an obvious match to the AI in batches of AI_MATCH_BATCH_SIZE.
+    Returns: pending_confirmations
+    """
+    indices = [i for i, track in enumerate(tracks) if track.get('candidates')]
+    pending_confirmations = []
+    
+    # Obvious string matches don't need an AI round-trip
+    clear_indices = []
+    clear_matches = []
+    for i in indices:
+        match = clear_best_match(tracks[i]['artist'], tracks[i]['title'], tracks[i]['candidates'])
+        if match:
+            clear_indices.append(i)
+            clear_matches.append(match)
+    apply_matches(tracks, clear_indices, clear_matches)
+    indices = [i for i in indices if tracks[i].get('candidates')]
+    
+    batches = [indices[i:i + AI_MATCH_BATCH_SIZE] for i in range(0, len(indices), AI_MATCH_BATCH_SIZE)]
+    query_batches = [
+        [(tracks[i]['artist'], tracks[i]['title'], tracks[i]['candidates']) for i in batch]
+        for batch in batches
+    ]
+    
+    if not batches:
+        return pending_confirmations
+    
+    if OPENAI_BATCH_MODE:
+        for batch, matches in zip(batches, find_best_matches_batch_api(query_batches)):
+            pending_confirmations.extend(apply_matches(tracks, batch, matches))
+        return pending_confirmations
+    
+    with ThreadPoolExecutor(max_workers=AI_MATCH_MAX_WORKERS) as executor:
+        future_to_batch = {
+            executor.submit(find_best_matches_bulk, queries): batch
+            for batch, queries in zip(batches, query_batches)
         }
+        
+        with tqdm(total=len(indices), desc=f"{Fore.CYAN}Matching with AI", unit="track") as pbar:
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                pending_confirmations.extend(apply_matches(tracks, batch, future.result()))
+                pbar.update(len(batch))
+    
+    return pending_confirmations
 
-def search_tracks_on_spotify_parallel(tracks: List[Dict], spotify: SpotifyAPI, max_workers: int = 1) -> tuple[List[Dict], List[Dict]]:
+def collect_search_results(future_to_index: Dict[Future, int], tracks: List[Dict]) -> tuple[List[Dict], List[Dict]]:
     """
-    Search for tracks on Spotify in parallel and return matches with URIs.
+    Wait for submitted track searches, then match their fuzzy candidates.
+    Tracks whose search failed are marked 'search_failed' so their result isn't cached.
     Returns: (matched_tracks, pending_confirmations)
     """
     matched_tracks = [None] * len(tracks)  # Pre-allocate list to maintain order
-    pending_confirmations = []
+    failed_count = 0
+    
+    # Process completed tasks with progress bar
+    with tqdm(total=len(tracks), desc=f"{Fore.CYAN}Searching Spotify", unit="track") as pbar:
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                matched_tracks[index] = future.result()
+            except Exception as e:
+                # If search fails, mark as not found
+                tracks[index]['spotify_uri'] = None
+                tracks[index]['found'] = False
+                tracks[index]['search_failed'] = True
+                matched_tracks[index] = tracks[index]
+                failed_count += 1
+            pbar.update(1)
+    
+    if failed_count:
+        print(f"{Fore.RED}✗ {failed_count} searches failed, they will be searched again on the next run")
+    
+    pending_confirmations = match_fuzzy_candidates(matched_tracks)
     
+    return matched_tracks, pending_confirmations
+
+def search_tracks_on_spotify_parallel(tracks: List[Dict], spotify: SpotifyAPI, max_workers: int = SPOTIFY_SEARCH_MAX_WORKERS) -> tuple[List[Dict], List[Dict]]:
+    """
+    Search for tracks on Spotify in parallel and return matches with URIs.
+    Returns: (matched_tracks, pending_confirmations)
+    """
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         future_to_index = {
@@ -635,164 +1122,224 @@ def search_tracks_on_spotify_parallel(tracks: List[Dict], spotify: SpotifyAPI, m
             for i, track in enumerate(tracks)
         }
         
-        # Process completed tasks with progress bar
-        with tqdm(total=len(tracks), desc=f"{Fore.CYAN}Searching Spotify", unit="track") as pbar:
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    result = future.result()
-                    matched_tracks[index] = result
-                    
-                    # Check if needs confirmation
-                    if result.get('pending_confirmation') and result.get('match_data'):
-                        pending_confirmations.append({
-                            **result['match_data'],
-                            'track_index': index
-                        })
-                    
-                    pbar.update(1)
-                    time.sleep(0.2)  # Small delay to avoid rate limiting
-                except Exception as e:
-                    # If search fails, mark as not found
-                    matched_tracks[index] = {
-                        **tracks[index],
-                        'spotify_uri': None,
-                        'found': False
-                    }
-                    pbar.update(1)
+        return collect_search_results(future_to_index, tracks)
+
+def read_json(path: Path):
+    """Read a JSON file written by write_json"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def write_json(path: Path, data, indent: bool = True):
+    """
+    Write data as JSON, encoded in one orjson call and a single write.
+    indent: pretty-print for files people read; the large files only the script reads are kept compact
+    """
+    # Replacing the file only once it is complete keeps the previous version if the run is interrupted
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+    os.replace(tmp_path, path)
+
+def save_playlist_uris(playlist_file: Path, show_alias: str, all_uris: List[str]) -> int:
+    """
+    Write the playlist details and every matched URI for create_spotify_playlist.
+    Returns: the number of tracks in the playlist
+    """
+    # Tracks played on several episodes go in once, where they were last played
+    playlist_uris = list(dict.fromkeys(all_uris))
     
-    return matched_tracks, pending_confirmations
+    playlist_data = {
+        'show_alias': show_alias,
+        'name': f'NTS RADIO - {show_alias.upper()} Collection',
+        'description': f'Tracks from {show_alias} shows on NTS Radio, compiled by (www.github.com/charlie-adam/nts_scraper)',
+        'total_tracks': len(playlist_uris),
+        'uris': playlist_uris
+    }
+    write_json(playlist_file, playlist_data)
+    return len(playlist_uris)
 
-def full_scrape_and_search(spotify: SpotifyAPI, show_alias: str):
-    """Complete scrape of NTS and search on Spotify"""
-    # Create data directory structure
-    data_dir = os.path.join('data', show_alias)
-    os.makedirs(data_dir, exist_ok=True)
+def search_key(artist: str, title: str) -> Tuple[str, str]:
+    """Cache key under which spelling variants of the same track share one search"""
+    return normalize_string(artist), normalize_string(title)
+
+def load_search_cache(cache_file: Path) -> Dict[Tuple[str, str], Optional[str]]:
+    """Load previous Spotify search results keyed by normalized (artist, title)"""
+    try:
+        entries = read_json(cache_file)
+    except FileNotFoundError:
+        return {}
+    return {search_key(entry['artist'], entry['title']): entry['spotify_uri'] for entry in entries}
+
+def save_search_cache(cache_file: Path, search_cache: Dict[Tuple[str, str], Optional[str]]):
+    """Save Spotify search results so later runs can skip already-searched tracks"""
+    entries = [
+        {'artist': artist, 'title': title, 'spotify_uri': uri}
+        for (artist, title), uri in search_cache.items()
+    ]
+    write_json(cache_file, entries, indent=False)
+
+def load_tapes(tapes_file: Path) -> Dict[str, Dict]:
+    """
+    Load tracklists scraped on earlier runs, keyed by episode alias.
+    A last line cut short by an interrupted run is removed, so new tapes can be appended after it.
+    """
+    try:
+        with open(tapes_file, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return {}
     
+    if content and not content.endswith(b"\n"):
+        # The episode on the partial line is fetched again
+        content = content[:content.rfind(b"\n") + 1]
+        with open(tapes_file, 'r+b') as f:
+            f.truncate(len(content))
+    
+    tapes = {}
+    for line in content.splitlines():
+        try:
+            tape = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        tapes[tape['episode']] = tape
+    return tapes
+
+def full_scrape_and_search(spotify: SpotifyAPI, show_alias: str, data_dir: Path):
+    """Complete scrape of NTS and search on Spotify"""
     api_url = f"https://www.nts.live/api/v2/shows/{show_alias}/episodes"
-    MAX_WORKERS = 5
-    REQUEST_DELAY = 0.3
     
     print(f"\n{Fore.CYAN}{'=' * 60}")
     print(f"{Fore.CYAN}STEP 1: Fetching all episode links...")
     print(f"{Fore.CYAN}{'=' * 60}")
-    episodes = get_all_episode_links(api_url)
+    # Episodes scraped on earlier runs are reused, only new ones are fetched
+    tapes_file_path = data_dir / TAPES_FILE
+    known_tapes = load_tapes(tapes_file_path)
+    episodes = get_all_episode_links(api_url, set(known_tapes))
     total_episodes = len(episodes)
     
+    # Search each unique normalized (artist, title) pair once; pairs searched on earlier runs come from the cache
+    cache_file = data_dir / SEARCH_CACHE_FILE
+    search_cache = load_search_cache(cache_file)
+    
     print(f"\n{Fore.CYAN}{'=' * 60}")
-    print(f"{Fore.CYAN}STEP 2: Processing {total_episodes} episodes...")
+    print(f"{Fore.CYAN}STEP 2: Processing {total_episodes} episodes (searching Spotify as tracklists arrive)...")
     print(f"{Fore.CYAN}{'=' * 60}\n")
     
-    all_tapes = []
-    
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = [executor.submit(process_episode, episode, REQUEST_DELAY) for episode in episodes]
+    all_tapes = list(known_tapes.values())
+    unique_tracks = {}
+    future_to_index = {}
+    
+    # Episodes are fetched from NTS while their tracks are already being searched on Spotify
+    with ThreadPoolExecutor(max_workers=NTS_FETCH_MAX_WORKERS) as nts_executor, \
+            ThreadPoolExecutor(max_workers=SPOTIFY_SEARCH_MAX_WORKERS) as spotify_executor, \
+            open(tapes_file_path, 'ab') as tapes_file:
+        def submit_searches(tape_data):
+            for track in tape_data['tracklist']:
+                key = search_key(track['artist'], track['title'])
+                if key not in search_cache and key not in unique_tracks:
+                    future_to_index[spotify_executor.submit(search_single_track, track, spotify)] = len(unique_tracks)
+                    unique_tracks[key] = track
+        
+        # Known episodes only need searching if the cache has lost some of their tracks
+        for tape_data in all_tapes:
+            submit_searches(tape_data)
+        
+        futures = [nts_executor.submit(process_episode, episode) for episode in episodes]
         
         with tqdm(total=total_episodes, desc=f"{Fore.CYAN}Processing episodes", unit="episode") as pbar:
             for future in as_completed(futures):
                 try:
                     tape_data = future.result()
+                    # Failed episodes are left out of tapes.ndjson so the next run fetches them again
+                    if tape_data is None:
+                        pbar.update(1)
+                        continue
                     all_tapes.append(tape_data)
+                    
+                    # Save each scraped tracklist as it arrives, before searches start updating it
+                    tapes_file.write(orjson.dumps(tape_data) + b"\n")
+                    
+                    submit_searches(tape_data)
+                    
                     pbar.update(1)
                 except Exception as e:
                     pbar.update(1)
-    
-    all_tapes.sort(key=lambda x: x['broadcast'], reverse=True)
-    
-    print(f"\n{Fore.CYAN}{'=' * 60}")
-    print(f"{Fore.CYAN}STEP 3: Searching tracks on Spotify (parallel)...")
-    print(f"{Fore.CYAN}{'=' * 60}\n")
-    
-    # Collect all tracks from all episodes
-    all_tracks = []
-    tape_track_mapping = []  # Keep track of which tracks belong to which tape
-    
-    for tape_idx, tape in enumerate(all_tapes):
-        tape_start = len(all_tracks)
-        if tape['track_count'] > 0:
-            all_tracks.extend(tape['tracklist'])
-        tape_end = len(all_tracks)
-        tape_track_mapping.append((tape_idx, tape_start, tape_end))
-    
-    # Search all tracks in parallel
-    if all_tracks:
-        matched_tracks, all_pending_confirmations = search_tracks_on_spotify_parallel(
-            all_tracks, spotify, max_workers=SPOTIFY_SEARCH_MAX_WORKERS
-        )
         
-        # Redistribute matched tracks back to their tapes
-        for tape_idx, start_idx, end_idx in tape_track_mapping:
-            all_tapes[tape_idx]['tracklist'] = matched_tracks[start_idx:end_idx]
+        all_tapes.sort(key=lambda x: x['broadcast_ts'], reverse=True)
+        
+        print(f"\n{Fore.CYAN}{'=' * 60}")
+        print(f"{Fore.CYAN}STEP 3: Searching tracks on Spotify (parallel)...")
+        print(f"{Fore.CYAN}{'=' * 60}\n")
+        
+        print(f"{Fore.CYAN}Searching {len(unique_tracks)} unique tracks ({len(search_cache)} cached)\n")
         
+        matched_tracks, pending_confirmations = collect_search_results(future_to_index, list(unique_tracks.values()))
+    
+    if unique_tracks:
         # Confirm fuzzy matches
-        if all_pending_confirmations:
-            confirmed_matches = confirm_matches(all_pending_confirmations)
+        if pending_confirmations:
+            confirmed_matches = confirm_matches(pending_confirmations)
             
-            # Update tracks based on confirmations
             confirmed_indices = {m['track_index'] for m in confirmed_matches}
             rejection_count = 0
             
-            # Find and update rejected matches
-            current_index = 0
-            for tape in all_tapes:
-                for track in tape['tracklist']:
-                    if track.get('pending_confirmation'):
-                        if current_index not in confirmed_indices:
-                            # User rejected this match
-                            track['spotify_uri'] = None
-                            track['found'] = False
-                            rejection_count += 1
-                        # Clean up temporary fields
-                        track.pop('pending_confirmation', None)
-                        track.pop('match_data', None)
-                    current_index += 1
+            for match in pending_confirmations:
+                if match['track_index'] not in confirmed_indices:
+                    # User rejected this match
+                    matched_tracks[match['track_index']]['spotify_uri'] = None
+                    rejection_count += 1
             
             print(f"\n{Fore.CYAN}✓ Rejected {rejection_count} fuzzy matches")
-    
-    # Save results
-    output_file = os.path.join(data_dir, 'tracklists_with_spotify.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_tapes, indent=2, fp=f, ensure_ascii=False)
-    
-    # Generate playlist URIs
+        
+        for key, result in zip(unique_tracks, matched_tracks):
+            # Failed searches stay out of the cache so they are tried again
+            if not result.pop('search_failed', False):
+                search_cache[key] = result['spotify_uri']
+            # Clean up temporary fields
+            result.pop('pending_confirmation', None)
+            result.pop('match_data', None)
+        save_search_cache(cache_file, search_cache)
+    
+    # Fill in every occurrence of each track from the cache, collecting the playlist URIs and counts in the same pass
     all_uris = []
+    total_tracks = 0
     for tape in all_tapes:
+        total_tracks += len(tape['tracklist'])
         for track in tape['tracklist']:
-            if track.get('spotify_uri'):
-                all_uris.append(track['spotify_uri'])
+            uri = search_cache.get(search_key(track['artist'], track['title']))
+            track['spotify_uri'] = uri
+            track['found'] = uri is not None
+            if uri:
+                all_uris.append(uri)
     
-    playlist_data = {
-        'show_alias': show_alias,
-        'name': f'NTS RADIO - {show_alias.upper()} Collection',
-        'description': f'Tracks from {show_alias} shows on NTS Radio, compiled by (www.github.com/charlie-adam/nts_scraper)',
-        'total_tracks': len(all_uris),
-        'uris': all_uris
-    }
+    # Save results
+    output_file = data_dir / TRACKLISTS_FILE
+    write_json(output_file, all_tapes, indent=False)
     
-    playlist_file = os.path.join(data_dir, 'playlist_uris.json')
-    with open(playlist_file, 'w', encoding='utf-8') as f:
-        json.dump(playlist_data, indent=2, fp=f)
+    # Save playlist URIs
+    playlist_file = data_dir / PLAYLIST_URIS_FILE
+    playlist_tracks = save_playlist_uris(playlist_file, show_alias, all_uris)
     
     # Summary
-    total_tracks = sum(tape['track_count'] for tape in all_tapes)
-    print(f"\n{Fore.GREEN}{'=' * 60}")
-    print(f"{Fore.GREEN}COMPLETE!")
-    print(f"{Fore.GREEN}{'=' * 60}")
-    print(f"{Fore.GREEN}✓ Episodes processed: {len(all_tapes)}")
-    print(f"{Fore.GREEN}✓ Total tracks: {total_tracks}")
-    print(f"{Fore.GREEN}✓ Tracks found on Spotify: {len(all_uris)}")
-    print(f"{Fore.GREEN}✓ Match rate: {len(all_uris)/total_tracks*100:.1f}%")
-    print(f"\n{Fore.YELLOW}✓ Full data saved to: {output_file}")
-    print(f"{Fore.YELLOW}✓ Playlist URIs saved to: {playlist_file}")
+    thread_safe_print("\n".join([
+        f"\n{Fore.GREEN}{'=' * 60}",
+        f"{Fore.GREEN}COMPLETE!",
+        f"{Fore.GREEN}{'=' * 60}",
+        f"{Fore.GREEN}✓ Episodes processed: {len(all_tapes)}",
+        f"{Fore.GREEN}✓ Total tracks: {total_tracks}",
+        f"{Fore.GREEN}✓ Tracks found on Spotify: {len(all_uris)}",
+        f"{Fore.GREEN}✓ Match rate: {len(all_uris)/total_tracks*100:.1f}%",
+        f"{Fore.GREEN}✓ Unique tracks in playlist: {playlist_tracks}",
+        f"\n{Fore.YELLOW}✓ Full data saved to: {output_file}",
+        f"{Fore.YELLOW}✓ Playlist URIs saved to: {playlist_file}"
+    ]))
      
-def retry_failed_tracks(spotify: SpotifyAPI, show_alias: str):
+def retry_failed_tracks(spotify: SpotifyAPI, show_alias: str, data_dir: Path):
     """Retry searching for tracks that weren't found"""
-    data_dir = os.path.join('data', show_alias)
-    input_file = os.path.join(data_dir, 'tracklists_with_spotify.json')
+    input_file = data_dir / TRACKLISTS_FILE
     
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            all_tapes = json.load(f)
+        all_tapes = read_json(input_file)
     except FileNotFoundError:
         print(f"{Fore.RED}✗ Error: {input_file} not found")
         print(f"{Fore.YELLOW}Please run option 1 first to generate the file")
@@ -802,114 +1349,91 @@ def retry_failed_tracks(spotify: SpotifyAPI, show_alias: str):
     print(f"{Fore.CYAN}Retrying failed track searches (parallel)...")
     print(f"{Fore.CYAN}{'=' * 60}\n")
     
-    # Collect failed tracks with their positions
-    failed_tracks_info = []
-    for tape_idx, tape in enumerate(all_tapes):
-        for track_idx, track in enumerate(tape['tracklist']):
-            if not track.get('found', False):
-                failed_tracks_info.append({
-                    'tape_idx': tape_idx,
-                    'track_idx': track_idx,
-                    'track': track
-                })
+    # Failed tracks are searched and updated in place, so their tapes see the results directly
+    # (option 1 sets 'found' on every track it saves)
+    failed_tracks = [track for tape in all_tapes for track in tape['tracklist'] if not track['found']]
     
-    if not failed_tracks_info:
+    if not failed_tracks:
         print(f"{Fore.GREEN}✓ No failed tracks to retry!")
         return
     
-    print(f"{Fore.CYAN}Found {len(failed_tracks_info)} failed tracks to retry\n")
+    # Tracks repeated across episodes are only searched once
+    unique_tracks = {}
+    for track in failed_tracks:
+        unique_tracks.setdefault(search_key(track['artist'], track['title']), track)
     
-    # Extract just the tracks for searching
-    failed_tracks = [info['track'] for info in failed_tracks_info]
+    print(f"{Fore.CYAN}Found {len(failed_tracks)} failed tracks to retry ({len(unique_tracks)} unique)\n")
     
     # Search all failed tracks in parallel
-    matched_tracks, pending_confirmations = search_tracks_on_spotify_parallel(
-        failed_tracks, spotify, max_workers=SPOTIFY_SEARCH_MAX_WORKERS
-    )
-    
-    # Update the original tapes with results
-    total_found = 0
-    for i, info in enumerate(failed_tracks_info):
-        result = matched_tracks[i]
-        tape_idx = info['tape_idx']
-        track_idx = info['track_idx']
-        
-        all_tapes[tape_idx]['tracklist'][track_idx] = result
-        
-        if result.get('found'):
-            total_found += 1
-            
-            # Add position info to pending confirmations
-            if result.get('pending_confirmation'):
-                for confirmation in pending_confirmations:
-                    if confirmation.get('track_index') == i:
-                        confirmation['tape_idx'] = tape_idx
-                        confirmation['track_idx'] = track_idx
-                        break
+    matched_tracks, pending_confirmations = search_tracks_on_spotify_parallel(list(unique_tracks.values()), spotify)
     
     # Confirm fuzzy matches
     if pending_confirmations:
         confirmed_matches = confirm_matches(pending_confirmations)
         
         # Update tracks based on confirmations
-        confirmed_set = {(m['tape_idx'], m['track_idx']) for m in confirmed_matches}
+        confirmed_indices = {m['track_index'] for m in confirmed_matches}
         rejection_count = 0
         
         for match in pending_confirmations:
-            tape_idx = match['tape_idx']
-            track_idx = match['track_idx']
+            track = matched_tracks[match['track_index']]
             
-            if (tape_idx, track_idx) not in confirmed_set:
+            if match['track_index'] not in confirmed_indices:
                 # User rejected this match
-                all_tapes[tape_idx]['tracklist'][track_idx]['spotify_uri'] = None
-                all_tapes[tape_idx]['tracklist'][track_idx]['found'] = False
-                total_found -= 1
+                track['spotify_uri'] = None
+                track['found'] = False
                 rejection_count += 1
             
             # Clean up temporary field
-            all_tapes[tape_idx]['tracklist'][track_idx].pop('pending_confirmation', None)
-            all_tapes[tape_idx]['tracklist'][track_idx].pop('match_data', None)
+            track.pop('pending_confirmation', None)
+            track.pop('match_data', None)
         
         print(f"\n{Fore.CYAN}✓ Rejected {rejection_count} fuzzy matches")
     
-    # Save updated results
-    with open(input_file, 'w', encoding='utf-8') as f:
-        json.dump(all_tapes, indent=2, fp=f, ensure_ascii=False)
-    
-    # Update playlist URIs
-    all_uris = []
-    for tape in all_tapes:
-        for track in tape['tracklist']:
-            if track.get('spotify_uri'):
-                all_uris.append(track['spotify_uri'])
-    
-    playlist_data = {
-        'show_alias': show_alias,
-        'name': f'NTS RADIO - {show_alias.upper()} Collection',
-        'description': f'Tracks from {show_alias} shows on NTS Radio, compiled by (www.github.com/charlie-adam/nts_scraper)',
-        'total_tracks': len(all_uris),
-        'uris': all_uris
-    }
-    
-    playlist_file = os.path.join(data_dir, 'playlist_uris.json')
-    with open(playlist_file, 'w', encoding='utf-8') as f:
-        json.dump(playlist_data, indent=2, fp=f)
-    
-    print(f"\n{Fore.GREEN}{'=' * 60}")
-    print(f"{Fore.GREEN}RETRY COMPLETE!")
-    print(f"{Fore.GREEN}{'=' * 60}")
-    print(f"{Fore.GREEN}✓ Tracks retried: {len(failed_tracks_info)}")
-    print(f"{Fore.GREEN}✓ New matches found: {total_found}")
-    print(f"{Fore.GREEN}✓ Total tracks in playlist: {len(all_uris)}")
+    # Record the retried results so the next full scrape reuses them
+    cache_file = data_dir / SEARCH_CACHE_FILE
+    search_cache = load_search_cache(cache_file)
+    for key, track in zip(unique_tracks, matched_tracks):
+        if not track.pop('search_failed', False):
+            search_cache[key] = track.get('spotify_uri')
+    save_search_cache(cache_file, search_cache)
     
-def create_spotify_playlist(spotify: SpotifyAPI, show_alias: str):
+    # Fill in every occurrence of each retried track
+    total_found = 0
+    for track in failed_tracks:
+        uri = search_cache.get(search_key(track['artist'], track['title']))
+        track['spotify_uri'] = uri
+        track['found'] = uri is not None
+        total_found += track['found']
+    
+    all_uris = [uri for tape in all_tapes for track in tape['tracklist'] if (uri := track.get('spotify_uri'))]
+    
+    # The saved files only change if a retried track was found (and its match kept)
+    if total_found:
+        # Save updated results
+        write_json(input_file, all_tapes, indent=False)
+        
+        # Update playlist URIs
+        playlist_tracks = save_playlist_uris(data_dir / PLAYLIST_URIS_FILE, show_alias, all_uris)
+    else:
+        playlist_tracks = len(set(all_uris))
+        print(f"\n{Fore.YELLOW}No new matches, saved files left unchanged")
+    
+    thread_safe_print("\n".join([
+        f"\n{Fore.GREEN}{'=' * 60}",
+        f"{Fore.GREEN}RETRY COMPLETE!",
+        f"{Fore.GREEN}{'=' * 60}",
+        f"{Fore.GREEN}✓ Tracks retried: {len(failed_tracks)}",
+        f"{Fore.GREEN}✓ New matches found: {total_found}",
+        f"{Fore.GREEN}✓ Total tracks in playlist: {playlist_tracks}"
+    ]))
+    
+def create_spotify_playlist(spotify: SpotifyAPI, show_alias: str, data_dir: Path):
     """Create playlist on Spotify from saved URIs"""
-    data_dir = os.path.join('data', show_alias)
-    playlist_file = os.path.join(data_dir, 'playlist_uris.json')
+    playlist_file = data_dir / PLAYLIST_URIS_FILE
     
     try:
-        with open(playlist_file, 'r', encoding='utf-8') as f:
-            playlist_data = json.load(f)
+        playlist_data = read_json(playlist_file)
     except FileNotFoundError:
         print(f"{Fore.RED}✗ Error: {playlist_file} not found")
         print(f"{Fore.YELLOW}Please run option 1 or 2 first to generate the file")
@@ -921,10 +1445,13 @@ def create_spotify_playlist(spotify: SpotifyAPI, show_alias: str):
     
     # Get user authorization if not already done
     if not spotify.user_token:
-        print(f"{Fore.YELLOW}User authorization required...")
-        if not spotify.get_user_authorization():
-            print(f"{Fore.RED}✗ Failed to get user authorization")
-            return
+        if spotify.refresh_user_token():
+            print(f"{Fore.GREEN}✓ Reused saved Spotify authorization")
+        else:
+            print(f"{Fore.YELLOW}User authorization required...")
+            if not spotify.get_user_authorization():
+                print(f"{Fore.RED}✗ Failed to get user authorization")
+                return
     
     # Get user ID
     print(f"\n{Fore.CYAN}Getting user information...")
@@ -990,7 +1517,8 @@ if __name__ == "__main__":
     
     # Initialize Spotify API
     spotify = SpotifyAPI(CLIENT_ID, CLIENT_SECRET)
-    spotify.get_access_token()
+    if not spotify.access_token:
+        spotify.get_access_token()
     
     # Get show alias
     show_alias = input(f"\n{Fore.YELLOW}Enter NTS show alias (e.g., 'm00dtapes'): ").strip().lower()
@@ -999,18 +1527,22 @@ if __name__ == "__main__":
         print(f"{Fore.RED}✗ Show alias cannot be empty")
         exit(1)
     
+    # Create data directory structure
+    data_dir = Path('data') / show_alias
+    data_dir.mkdir(parents=True, exist_ok=True)
+    
     while True:
         show_menu()
         choice = input(f"{Fore.YELLOW}Select option (1-4): ").strip()
         
         if choice == "1":
-            full_scrape_and_search(spotify, show_alias)
+            full_scrape_and_search(spotify, show_alias, data_dir)
         
         elif choice == "2":
-            retry_failed_tracks(spotify, show_alias)
+            retry_failed_tracks(spotify, show_alias, data_dir)
         
         elif choice == "3":
-            create_spotify_playlist(spotify, show_alias)
+            create_spotify_playlist(spotify, show_alias, data_dir)
         
         elif choice == "4":
             print(f"\n{Fore.CYAN}Exiting... Goodbye!")